@@ -1,10 +1,23 @@
-from pymongo import MongoClient
+from pymongo import MongoClient, InsertOne
+from pymongo.errors import OperationFailure
 import pandas as pd
 import boto3
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 import os
+import re
+import time
+import copy
+import math
+import functools
+import heapq
+import operator
+import concurrent.futures
 import tkinter as tk
 from tkinter import simpledialog, messagebox, scrolledtext, StringVar, Radiobutton
 from decimal import Decimal, InvalidOperation
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 load_dotenv()
 
@@ -12,20 +25,88 @@ aws_access_key_id = os.getenv("AWS_ACCESS_KEY_ID")
 aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
 aws_region = os.getenv("AWS_DEFAULT_REGION")
 
+# Upper bound on the number of parallel scan segments used by find_movies
+MAX_SCAN_SEGMENTS = 16
+# Documents per bulk write when loading the CSV into MongoDB
+MONGO_LOAD_CHUNK = 10000
+# MongoDB fields searchable through find_movies, each indexed together with rating
+INDEXED_FIELDS = ('casts', 'directors', 'genre', 'certificate')
+# Items requested per scan page by the DynamoDB paginator
+SCAN_PAGE_SIZE = 500
+# Shown in the results area while a lookup runs on the worker thread
+SEARCHING_TEXT = "Searching...\n"
+# Shortest actor/director text accepted by the GUI before it scans the database
+MIN_QUERY_LENGTH = 2
+# Attributes fetched by find_movies; full items are only read by get_movie_details
+SEARCH_PROJECTION = '#n, rating'
+# Global secondary index used to query movies by their primary genre, sorted by rating
+GENRE_INDEX_NAME = 'primary_genre-rating-index'
+# Number of threads used to write items to DynamoDB when loading the CSV
+LOAD_WRITERS = 8
+# Attempts per chunk before giving up when DynamoDB throttles the load
+LOAD_MAX_ATTEMPTS = 5
+# Number of distinct queries kept in the in-process result cache
+QUERY_CACHE_SIZE = 256
+
+# Connection pool and retry settings shared by every DynamoDB resource
+DYNAMODB_CONFIG = Config(max_pool_connections=32, retries={'total_max_attempts': 5, 'mode': 'adaptive'})
+
+# Ratings repeat a lot (0.0-10.0 in steps of 0.1), so parsed Decimals are reused
+_DEC_CACHE = {}
+_DEC_CACHE_SIZE = 1024
+
+# Reused across MovieEncyclopedia instances so connections survive between them
+_boto3_session = None
+_mongo_clients = {}
+
+
+def get_boto3_session():
+    global _boto3_session
+    if _boto3_session is None:
+        _boto3_session = boto3.session.Session()
+    return _boto3_session
+
+
+def dec(value):
+    # Decimal(str(value)), memoized on the string form
+    s = str(value)
+    if s not in _DEC_CACHE:
+        if len(_DEC_CACHE) >= _DEC_CACHE_SIZE:
+            _DEC_CACHE.clear()
+        _DEC_CACHE[s] = Decimal(s)
+    return _DEC_CACHE[s]
+
+
+def get_mongo_client(db_uri):
+    if db_uri not in _mongo_clients:
+        _mongo_clients[db_uri] = MongoClient(db_uri, maxPoolSize=50, connect=False, serverSelectionTimeoutMS=3000)
+    return _mongo_clients[db_uri]
+
 
 class MovieEncyclopedia:
     def __init__(self, db_choice, db_uri='mongodb://localhost:27017/', region_name='us-west-2'):
         self.db_choice = db_choice
+        # UpdateExpression and attribute names per set of updated keys, see update_expression
+        self._update_expr_cache = {}
+        # Cache read results per instance; cleared whenever the data changes
+        self._cached_find_movies = functools.lru_cache(maxsize=QUERY_CACHE_SIZE)(self._find_movies)
+        self._cached_movie_details = functools.lru_cache(maxsize=QUERY_CACHE_SIZE)(self._get_movie_details)
         if db_choice == 'mongodb':
-            self.client = MongoClient(db_uri)
+            self.client = get_mongo_client(db_uri)
             self.db = self.client['movie_encyclopedia_db']
             self.movies = self.db.movies
         elif db_choice == 'dynamodb':
-            self.dynamodb = boto3.resource('dynamodb', region_name=region_name)
+            self.dynamodb = get_boto3_session().resource('dynamodb', region_name=region_name, config=DYNAMODB_CONFIG)
             self.table_name = 'Movies'  # This should be set before calling ensure_table_exists
             self.ensure_table_exists()  # Now this call can successfully reference self.table_name
             self.table = self.dynamodb.Table(self.table_name)
 
+    def ensure_indexes(self):
+        # Index each searchable field together with rating so find_movies can sort from the index
+        for field in INDEXED_FIELDS:
+            self.movies.create_index([(field, 1), ('rating', -1)])
+        self.movies.create_index([('name', 1)])
+
     def ensure_table_exists(self):
         try:
             self.table = self.dynamodb.Table(self.table_name)
@@ -38,7 +119,23 @@ class MovieEncyclopedia:
                     {'AttributeName': 'name', 'KeyType': 'HASH'}
                 ],
                 AttributeDefinitions=[
-                    {'AttributeName': 'name', 'AttributeType': 'S'}
+                    {'AttributeName': 'name', 'AttributeType': 'S'},
+                    {'AttributeName': 'primary_genre', 'AttributeType': 'S'},
+                    {'AttributeName': 'rating', 'AttributeType': 'N'}
+                ],
+                GlobalSecondaryIndexes=[
+                    {
+                        'IndexName': GENRE_INDEX_NAME,
+                        'KeySchema': [
+                            {'AttributeName': 'primary_genre', 'KeyType': 'HASH'},
+                            {'AttributeName': 'rating', 'KeyType': 'RANGE'}
+                        ],
+                        'Projection': {'ProjectionType': 'ALL'},
+                        'ProvisionedThroughput': {
+                            'ReadCapacityUnits': 5,
+                            'WriteCapacityUnits': 5
+                        }
+                    }
                 ],
                 ProvisionedThroughput={
                     'ReadCapacityUnits': 5,
@@ -46,104 +143,282 @@ class MovieEncyclopedia:
                 }
             )
             self.table.wait_until_exists()
+            self.table.reload()  # Pick up the final status of the table and its index
             print(f"Table '{self.table_name}' created successfully.")
-
+        self.ensure_genre_index()
+        # Worked out once here rather than per search, since it needs the table description
+        self.scan_segments = self.scan_segment_count(self.table.table_size_bytes)
+
+
+    def ensure_genre_index(self):
+        # Tables created before the genre index existed have to have it added
+        statuses = {index['IndexName']: index['IndexStatus'] for index in self.table.global_secondary_indexes or []}
+        if GENRE_INDEX_NAME not in statuses:
+            print(f"Adding index '{GENRE_INDEX_NAME}' to table '{self.table_name}'...")
+            index = {
+                'IndexName': GENRE_INDEX_NAME,
+                'KeySchema': [
+                    {'AttributeName': 'primary_genre', 'KeyType': 'HASH'},
+                    {'AttributeName': 'rating', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'}
+            }
+            # On-demand tables must not be given throughput for the index
+            if (self.table.billing_mode_summary or {}).get('BillingMode') != 'PAY_PER_REQUEST':
+                index['ProvisionedThroughput'] = {
+                    'ReadCapacityUnits': 5,
+                    'WriteCapacityUnits': 5
+                }
+            try:
+                self.table.update(
+                    AttributeDefinitions=[
+                        {'AttributeName': 'primary_genre', 'AttributeType': 'S'},
+                        {'AttributeName': 'rating', 'AttributeType': 'N'}
+                    ],
+                    GlobalSecondaryIndexUpdates=[{'Create': index}]
+                )
+                statuses[GENRE_INDEX_NAME] = 'CREATING'
+            except ClientError as e:
+                # e.g. no UpdateTable permission, or another index is still being built
+                print(f"Failed to add index '{GENRE_INDEX_NAME}': {e}")
+        # Until the index exists and has finished backfilling, genre searches fall back to a scan
+        self.genre_index_active = statuses.get(GENRE_INDEX_NAME) == 'ACTIVE'
 
     def load_movies_from_csv(self, csv_file_path):
-        df = pd.read_csv(csv_file_path)
-        df['casts'] = df['casts'].apply(lambda x: x.split(','))
-        df['directors'] = df['directors'].apply(lambda x: x.split(','))
-        df['genre'] = df['genre'].apply(lambda x: x.split(','))
-        if self.db_choice == 'mongodb':
-            self.movies.drop()  # Clear existing collection to avoid duplicates
-            movies_data = df.to_dict('records')
-            self.movies.insert_many(movies_data)
-            if self.db_choice == 'dynamodb':
-                with self.table.batch_writer() as batch:
-                    for _, row in df.iterrows():
-                        # Example: taking the first genre as the primary genre for indexing
-                        primary_genre = row['genre'][0] if row['genre'] else 'None'
-                        item = {
-                            'name': row['name'],
-                            'year': str(row['year']),
-                            'rating': str(row['rating']),
-                            'certificate': row['certificate'],
-                            'genre': row['genre'],
-                            'primary_genre': primary_genre,  # This field would be used for GSI
-                            'casts': row['casts'],
-                            'directors': row['directors']
-                        }
-                        batch.put_item(Item=item)
+        try:
+            df = pd.read_csv(csv_file_path)
+            # Vectorized splits; missing values become empty lists instead of NaN
+            no_values = pd.Series([[] for _ in range(len(df))], index=df.index)
+            for column in ('casts', 'directors', 'genre'):
+                values = df[column].str.split(',')
+                df[column] = values.where(values.notna(), no_values)
+            if self.db_choice == 'mongodb':
+                self.movies.drop()  # Clear existing collection to avoid duplicates
+                # Store rating as a number so sorting never has to parse strings
+                df['rating'] = df['rating'].astype(float)
+                movies_data = df.to_dict('records')
+                # Unordered bulk writes let the server apply inserts in parallel, and chunking bounds memory
+                for i in range(0, len(movies_data), MONGO_LOAD_CHUNK):
+                    chunk = movies_data[i:i + MONGO_LOAD_CHUNK]
+                    self.movies.bulk_write([InsertOne(doc) for doc in chunk], ordered=False)
+                self.ensure_indexes()  # Dropping the collection also dropped its indexes
+            elif self.db_choice == 'dynamodb':
+                # Taking the first genre as the primary genre for indexing
+                df['primary_genre'] = df['genre'].str[0].fillna('None')
+                df['year'] = df['year'].astype(str)
+                # Stored as a number so the genre index sorts by rating numerically
+                df['rating'] = df['rating'].apply(dec)
+                items = df[['name', 'year', 'rating', 'certificate', 'genre', 'primary_genre', 'casts',
+                            'directors']].to_dict('records')
+                # Split the items into one chunk per writer thread
+                chunk_size = math.ceil(len(items) / LOAD_WRITERS) or 1
+                chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+                with concurrent.futures.ThreadPoolExecutor(max_workers=LOAD_WRITERS) as executor:
+                    futures = [executor.submit(self.write_chunk, chunk) for chunk in chunks]
+                    for future in futures:
+                        future.result()
+                # DynamoDB only refreshes the reported table size every few hours, so size the
+                # scan from the CSV that was just loaded instead. The table isn't cleared first,
+                # so never go below what the existing data already needed.
+                self.scan_segments = max(self.scan_segments,
+                                         self.scan_segment_count(os.path.getsize(csv_file_path)))
+        finally:
+            # Clear even if the load failed part-way, since some of the writes may have landed
+            self.clear_query_cache()
+
+    def write_chunk(self, items):
+        # Write a chunk of items in batches of 25 through the shared client, which (unlike
+        # resources) is thread-safe; throttled or unprocessed items are retried with backoff
+        client = self.dynamodb.meta.client
+        serializer = TypeSerializer()
+        requests = [{'PutRequest': {'Item': {k: serializer.serialize(v) for k, v in item.items()}}}
+                    for item in items]
+        attempt = 0
+        while requests:
+            batch, requests = requests[:25], requests[25:]
+            try:
+                response = client.batch_write_item(RequestItems={self.table_name: batch})
+                unprocessed = response.get('UnprocessedItems', {}).get(self.table_name, [])
+            except ClientError as e:
+                if (e.response['Error']['Code'] != 'ProvisionedThroughputExceededException'
+                        or attempt == LOAD_MAX_ATTEMPTS - 1):
+                    raise
+                unprocessed = batch
+            if not unprocessed:
+                attempt = 0
+                continue
+            if attempt == LOAD_MAX_ATTEMPTS - 1:
+                raise RuntimeError(f"Failed to write {len(unprocessed)} movies to '{self.table_name}'")
+            time.sleep(2 ** attempt * 0.1)
+            attempt += 1
+            requests = unprocessed + requests
 
     def add_movie(self, movie_data):
-        # Check if the database choice is MongoDB and convert Decimal to float
-        if self.db_choice == 'mongodb':
-            # Convert all Decimal values to float for MongoDB compatibility
-            movie_data['rating'] = float(movie_data['rating'])  # Convert Decimal to float for MongoDB
-
-        # Insert the movie data into the appropriate database
-        if self.db_choice == 'mongodb':
-            self.movies.insert_one(movie_data)
-        elif self.db_choice == 'dynamodb':
-            self.table.put_item(Item=movie_data)  # DynamoDB expects Decimal
+        try:
+            # Check if the database choice is MongoDB and convert Decimal to float
+            if self.db_choice == 'mongodb':
+                # Convert all Decimal values to float for MongoDB compatibility
+                movie_data['rating'] = float(movie_data['rating'])  # Convert Decimal to float for MongoDB
+
+            # Insert the movie data into the appropriate database
+            if self.db_choice == 'mongodb':
+                self.movies.insert_one(movie_data)
+            elif self.db_choice == 'dynamodb':
+                # Keep the primary genre in sync so the movie shows up in genre queries
+                if movie_data.get('genre'):
+                    movie_data['primary_genre'] = movie_data['genre'][0]
+                self.table.put_item(Item=movie_data)  # DynamoDB expects Decimal
+        finally:
+            self.clear_query_cache()
 
     def update_movie(self, movie_name, update_data):
-        # Check if the database choice is MongoDB and convert Decimal to float
-        if self.db_choice == 'mongodb':
-            # Convert all Decimal values to float for MongoDB compatibility
-            for key, value in update_data.items():
-                if isinstance(value, Decimal):
-                    update_data[key] = float(value)
-
-        # Perform the update operation on the appropriate database
-        if self.db_choice == 'mongodb':
-            self.movies.update_one({'name': movie_name}, {'$set': update_data})
-        elif self.db_choice == 'dynamodb':
-            # For DynamoDB, ensure all numerical values are in Decimal format
-            for key, value in update_data.items():
-                if isinstance(value, float):  # Convert float to Decimal if necessary
-                    update_data[key] = Decimal(str(value))
-            self.table.update_item(
-                Key={'name': movie_name},
-                UpdateExpression="set " + ", ".join([f"{k}= :{k}" for k in update_data.keys()]),
-                ExpressionAttributeValues={f":{k}": v for k, v in update_data.items()}
+        try:
+            # Check if the database choice is MongoDB and convert Decimal to float
+            if self.db_choice == 'mongodb':
+                # Convert all Decimal values to float for MongoDB compatibility
+                for key, value in update_data.items():
+                    if isinstance(value, Decimal):
+                        update_data[key] = float(value)
+
+            # Perform the update operation on the appropriate database
+            if self.db_choice == 'mongodb':
+                self.movies.update_one({'name': movie_name}, {'$set': update_data})
+            elif self.db_choice == 'dynamodb':
+                # For DynamoDB, ensure all numerical values are in Decimal format
+                for key, value in update_data.items():
+                    if isinstance(value, float):  # Convert float to Decimal if necessary
+                        update_data[key] = dec(value)
+                update_expression, attribute_names = self.update_expression(update_data.keys())
+                self.table.update_item(
+                    Key={'name': movie_name},
+                    UpdateExpression=update_expression,
+                    ExpressionAttributeNames=attribute_names,
+                    ExpressionAttributeValues={f":{k}": v for k, v in update_data.items()}
+                )
+        finally:
+            self.clear_query_cache()
+
+    def update_expression(self, keys):
+        # Build the expression once per key set; names go through placeholders so
+        # reserved words such as 'name' can be updated too
+        cache_key = frozenset(keys)
+        if cache_key not in self._update_expr_cache:
+            self._update_expr_cache[cache_key] = (
+                "SET " + ", ".join(f"#{k} = :{k}" for k in sorted(cache_key)),
+                {f"#{k}": k for k in cache_key}
             )
+        return self._update_expr_cache[cache_key]
 
     def delete_movie(self, movie_name):
         """Delete a movie from the database."""
-        if self.db_choice == 'mongodb':
-            result = self.movies.delete_one({'name': movie_name})
-            if result.deleted_count == 0:
-                print("No movie found with that name.")
-            else:
-                print(f"Deleted movie: {movie_name}")
-        elif self.db_choice == 'dynamodb':
-            try:
-                response = self.table.delete_item(
-                    Key={'name': movie_name}
-                )
-                print(f"Deleted movie: {movie_name}")
-            except Exception as e:
-                print(f"Failed to delete movie: {e}")
+        try:
+            if self.db_choice == 'mongodb':
+                result = self.movies.delete_one({'name': movie_name})
+                if result.deleted_count == 0:
+                    print("No movie found with that name.")
+                else:
+                    print(f"Deleted movie: {movie_name}")
+            elif self.db_choice == 'dynamodb':
+                try:
+                    response = self.table.delete_item(
+                        Key={'name': movie_name}
+                    )
+                    print(f"Deleted movie: {movie_name}")
+                except Exception as e:
+                    print(f"Failed to delete movie: {e}")
+        finally:
+            self.clear_query_cache()
+
+    def clear_query_cache(self):
+        self._cached_find_movies.cache_clear()
+        self._cached_movie_details.cache_clear()
+
     def find_movies(self, key, value):
+        # Hand out a copy so callers can't mutate the cached result
+        return copy.deepcopy(self._cached_find_movies(key, value))
+
+    def _find_movies(self, key, value):
         if self.db_choice == 'mongodb':
-            return list(self.movies.find({key: value}, {"_id": 0}).sort("rating", -1).limit(20))
-        elif self.db_choice == 'dynamodb':
-            # DynamoDB: Scan to retrieve items matching the filter
-            response = self.table.scan(
-                FilterExpression=f'contains({key}, :val)',
-                ExpressionAttributeValues={':val': value}
+            # One batch holds the whole result, so it arrives in a single round-trip
+            cursor = self.movies.find({key: value}, {"_id": 0, "name": 1, "rating": 1}).sort("rating", -1)
+            cursor = cursor.limit(20).batch_size(20)
+            if key in INDEXED_FIELDS:
+                try:
+                    # Point the planner straight at the matching index instead of trialling candidate plans
+                    return list(cursor.clone().hint([(key, 1), ('rating', -1)]))
+                except OperationFailure:
+                    # The index only exists once the collection has been loaded from the CSV
+                    pass
+            return list(cursor)
+        elif self.db_choice == 'dynamodb' and key == 'genre' and self.genre_index_active:
+            # DynamoDB: Query the genre index, which already returns items sorted by rating
+            response = self.table.query(
+                IndexName=GENRE_INDEX_NAME,
+                KeyConditionExpression=Key('primary_genre').eq(value),
+                ScanIndexForward=False,
+                Limit=20,
+                ProjectionExpression=SEARCH_PROJECTION,
+                ExpressionAttributeNames={'#n': 'name'}
             )
-            # Sort items manually by 'rating' in descending order and limit to 20 results
-            sorted_items = sorted(response['Items'], key=lambda x: float(x['rating']), reverse=True)[:20]
-            return sorted_items
+            return response['Items']
+        elif self.db_choice == 'dynamodb':
+            # DynamoDB: Scan the table in parallel segments to retrieve items matching the filter
+            total_segments = self.scan_segments
+            if key == 'genre':
+                # Match the same way the genre index does: only the primary genre counts
+                filter_expression, key = '#k = :val', 'primary_genre'
+            else:
+                filter_expression = 'contains(#k, :val)'
+            scan_kwargs = dict(FilterExpression=filter_expression,
+                               ProjectionExpression=SEARCH_PROJECTION,
+                               ExpressionAttributeNames={'#n': 'name', '#k': key},
+                               ExpressionAttributeValues={':val': value})
+            if total_segments == 1:
+                # Small table: a plain scan is cheaper than starting a thread pool
+                items = self._scan_paginated(**scan_kwargs)
+            else:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=total_segments) as executor:
+                    futures = [
+                        executor.submit(self._scan_paginated, Segment=segment, TotalSegments=total_segments,
+                                        **scan_kwargs)
+                        for segment in range(total_segments)
+                    ]
+                    items = [item for future in futures for item in future.result()]
+            # Pick the 20 highest rated items without sorting the whole result set;
+            # ratings are stored as numbers, so they compare without any parsing
+            return heapq.nlargest(20, items, key=operator.itemgetter('rating'))
 
         else:
             return []
 
+    def scan_segment_count(self, size_bytes):
+        # One segment per ~1 MB of table data, since that is the most a single scan page returns
+        segments = math.ceil(size_bytes / (1024 * 1024))
+        return max(1, min(segments, MAX_SCAN_SEGMENTS))
+
+    def _scan_paginated(self, **scan_kwargs):
+        # Scan the table (or one segment of it) page by page through the client paginator,
+        # which takes care of following LastEvaluatedKey until it is exhausted. The client is
+        # thread-safe, so every segment shares it and its connection pool.
+        serializer, deserializer = TypeSerializer(), TypeDeserializer()
+        if 'ExpressionAttributeValues' in scan_kwargs:
+            scan_kwargs['ExpressionAttributeValues'] = {
+                k: serializer.serialize(v) for k, v in scan_kwargs['ExpressionAttributeValues'].items()
+            }
+        paginator = self.dynamodb.meta.client.get_paginator('scan')
+        pages = paginator.paginate(TableName=self.table_name, PaginationConfig={'PageSize': SCAN_PAGE_SIZE},
+                                   **scan_kwargs)
+        # The client returns items in DynamoDB's wire format, so convert them back to plain values
+        return [{k: deserializer.deserialize(v) for k, v in item.items()}
+                for page in pages for item in page['Items']]
+
     def get_movie_details(self, movie_name):
+        return copy.deepcopy(self._cached_movie_details(movie_name))
+
+    def _get_movie_details(self, movie_name):
         if self.db_choice == 'mongodb':
-            return self.movies.find_one({"name": {"$regex": movie_name, "$options": "i"}}, {"_id": 0})
+            # Escape the user's text so regex metacharacters are matched literally
+            return self.movies.find_one({"name": {"$regex": re.escape(movie_name), "$options": "i"}}, {"_id": 0})
         if self.db_choice == 'dynamodb':
             response = self.table.get_item(
                 Key={'name': movie_name}
@@ -156,9 +431,44 @@ class MovieEncyclopediaGUI:
     def __init__(self, master, encyclopedia):
         self.master = master
         self.encyclopedia = encyclopedia
+        # Database calls run here so the Tk main loop never blocks on them. A single worker
+        # keeps operations in submission order and off the shared boto3 resource concurrently.
+        self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # DynamoDB searches genres through the primary genre index, so say so in the menu
+        if encyclopedia.db_choice == 'dynamodb':
+            self.genre_operation = "Find movies by primary genre"
+        else:
+            self.genre_operation = "Find movies by genre"
         master.title("Movie Encyclopedia")
+        master.protocol("WM_DELETE_WINDOW", self.close)
         self.setup_widgets()
 
+    def close(self):
+        # Drop queued operations and close the window right away; a lookup that is already
+        # running still finishes before the process exits, since executor threads are joined
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.master.destroy()
+
+    def run_in_background(self, callback, func, *args):
+        # Run func on the worker thread and hand its result to callback on the Tk thread
+        future = self.pool.submit(func, *args)
+        self.poll_future(future, callback)
+
+    def poll_future(self, future, callback):
+        # Tk widgets may only be touched from the main thread, so poll rather than call back directly
+        if future.done():
+            try:
+                result = future.result()
+            except Exception as e:
+                # Don't leave the placeholder up for an operation that failed
+                if self.text.get('1.0', tk.END) == SEARCHING_TEXT + '\n':
+                    self.text.delete('1.0', tk.END)
+                messagebox.showerror("Error", f"Operation failed: {e}")
+                return
+            callback(result)
+        else:
+            self.master.after(50, self.poll_future, future, callback)
+
     def setup_widgets(self):
         # Dropdown menu for selecting operation type
         self.operation_var = StringVar(self.master)
@@ -166,7 +476,7 @@ class MovieEncyclopediaGUI:
 
         operations = [
             "Find movies by actor", "Find movies by director",
-            "Find movies by genre", "Find movies by certificate",
+            self.genre_operation, "Find movies by certificate",
             "Get movie details", "Add Movie", "Update Movie", "Delete Movie"
         ]
 
@@ -201,13 +511,25 @@ class MovieEncyclopediaGUI:
 
     def execute_operation(self):
         operation = self.operation_var.get()
-        detail = self.details_entry.get()
+        detail = self.details_entry.get().strip()
+
+        # Reject empty lookups, and short actor/director text, since those searches cost a full
+        # table scan on DynamoDB; other lookups can legitimately be one character (e.g. the "R"
+        # certificate or the film "M")
+        lookups = ("Find movies by actor", "Find movies by director", self.genre_operation,
+                   "Find movies by certificate", "Get movie details")
+        scanned = ("Find movies by actor", "Find movies by director")
+        min_length = MIN_QUERY_LENGTH if operation in scanned else 1
+        if operation in lookups and len(detail) < min_length:
+            self.text.delete('1.0', tk.END)
+            self.text.insert(tk.END, f"Enter at least {min_length} character(s).\n")
+            return
 
         if operation == "Find movies by actor":
             self.perform_search("casts", detail)
         elif operation == "Find movies by director":
             self.perform_search("directors", detail)
-        elif operation == "Find movies by genre":
+        elif operation == self.genre_operation:
             self.perform_search("genre", detail)
         elif operation == "Find movies by certificate":
             self.perform_search("certificate", detail)
@@ -221,22 +543,33 @@ class MovieEncyclopediaGUI:
             self.delete_movie()
 
     def perform_search(self, key, value):
-        results = self.encyclopedia.find_movies(key, value)
+        self.text.delete('1.0', tk.END)
+        self.text.insert(tk.END, SEARCHING_TEXT)
+        self.run_in_background(self.render_results, self.encyclopedia.find_movies, key, value)
+
+    def render_results(self, results):
         self.text.delete('1.0', tk.END)
         if results:
-            for movie in results:
-                self.text.insert(tk.END, f"{movie['name']} - Rating: {movie.get('rating', 'N/A')}\n")
+            # Build the whole listing first so the widget is updated with a single insert
+            lines = '\n'.join(f"{movie['name']} - Rating: {movie.get('rating', 'N/A')}" for movie in results)
+            self.text.insert(tk.END, lines + '\n')
         else:
             self.text.insert(tk.END, "No movies found.\n")
+        self.text.update_idletasks()
 
     def get_movie_details(self, movie_name):
-        movie = self.encyclopedia.get_movie_details(movie_name)
+        self.text.delete('1.0', tk.END)
+        self.text.insert(tk.END, SEARCHING_TEXT)
+        self.run_in_background(self.render_movie_details, self.encyclopedia.get_movie_details, movie_name)
+
+    def render_movie_details(self, movie):
         self.text.delete('1.0', tk.END)
         if movie:
             self.text.insert(tk.END,
                                  f"Name: {movie['name']}\nYear: {movie.get('year', 'N/A')}\nRating: {movie.get('rating', 'N/A')}\nGenre: {', '.join(movie.get('genre', []))}\nCertificate: {movie.get('certificate', 'N/A')}\nDirector: {', '.join(movie.get('directors', []))}\n")
         else:
             self.text.insert(tk.END, "Movie not found.\n")
+        self.text.update_idletasks()
 
     def add_movie(self):
         name = self.movie_name_entry.get()
@@ -249,8 +582,8 @@ class MovieEncyclopediaGUI:
 
         try:
             # Use Decimal for initial data handling; conversion to float is handled in the encyclopedia method for MongoDB
-            rating = Decimal(rating_str)
-        except ValueError:
+            rating = dec(rating_str)
+        except (ValueError, InvalidOperation):
             messagebox.showerror("Error", "Invalid rating. Please enter a numeric value.")
             return
 
@@ -260,14 +593,11 @@ class MovieEncyclopediaGUI:
             return
 
         movie_data = {'name': name, 'genre': genres, 'rating': rating}
-        self.encyclopedia.add_movie(movie_data)
-        self.text.insert(tk.END, f"Added movie: {name}\n")
+        self.run_in_background(lambda _: self.text.insert(tk.END, f"Added movie: {name}\n"),
+                               self.encyclopedia.add_movie, movie_data)
     def find_movies(self):
         name = self.movie_name_entry.get()
-        results = self.encyclopedia.find_movies('name', name)
-        self.text.delete('1.0', tk.END)
-        for movie in results:
-            self.text.insert(tk.END, f"{movie['name']} - {movie.get('rating', 'N/A')}\n")
+        self.perform_search('name', name)
 
     def update_movie(self):
         name = self.movie_name_entry.get()  # Get the movie name from the entry widget
@@ -277,20 +607,22 @@ class MovieEncyclopediaGUI:
             messagebox.showinfo("Cancelled", "Update operation cancelled.")
             return
 
-        # Convert the rating to Decimal for initial data handling
-        new_rating = Decimal(new_rating)
+        # Convert the rating to Decimal for initial data handling; going through str keeps
+        # 7.3 as Decimal('7.3') rather than its full binary float expansion
+        new_rating = dec(new_rating)
 
         # Create the update data dictionary
         update_data = {'rating': new_rating}
 
         # Call the update_movie method of the encyclopedia with the gathered inputs
-        self.encyclopedia.update_movie(name, update_data)
-        self.text.insert(tk.END, f"Updated movie: {name} with new rating: {new_rating}\n")
+        self.run_in_background(
+            lambda _: self.text.insert(tk.END, f"Updated movie: {name} with new rating: {new_rating}\n"),
+            self.encyclopedia.update_movie, name, update_data)
 
     def delete_movie(self):
         name = self.movie_name_entry.get()
-        self.encyclopedia.delete_movie(name)
-        self.text.insert(tk.END, f"Deleted movie: {name}\n")
+        self.run_in_background(lambda _: self.text.insert(tk.END, f"Deleted movie: {name}\n"),
+                               self.encyclopedia.delete_movie, name)
 
 
 # Example usage